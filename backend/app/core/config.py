@@ -7,6 +7,7 @@ class Settings:
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+    SLO_EVALUATION_INTERVAL_SECONDS: float = float(os.getenv("SLO_EVALUATION_INTERVAL_SECONDS", "5"))
     CORS_ORIGINS: List[str] = [
         origin.strip()
         for origin in os.getenv(
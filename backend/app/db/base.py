@@ -5,4 +5,6 @@ Base = declarative_base()
 from app.models.user import User 
 from app.models.project import Project  
 from app.models.service import Service 
+from app.models.log_message import LogMessage
 from app.models.log import Log  
+from app.models.slo import SLO
@@ -0,0 +1,83 @@
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import engine
+from app.models.log import Log
+from app.models.log_message import LogMessage
+
+
+def _column_names(connection, table_name: str) -> set[str]:
+    return {row[1] for row in connection.execute(text(f"PRAGMA table_info({table_name})")).fetchall()}
+
+
+def _restore_stranded_legacy_logs(connection) -> None:
+    # Conversions from before the migration ran in a single transaction could stop after
+    # renaming logs, leaving the history in logs_legacy next to a new, empty logs table.
+    if "message" not in _column_names(connection, "logs_legacy"):
+        return
+
+    if connection.execute(text("SELECT EXISTS (SELECT 1 FROM logs)")).scalar():
+        raise RuntimeError(
+            "Found legacy log rows in logs_legacy, but logs already has new rows. Merge or "
+            "drop logs_legacy by hand before starting the app."
+        )
+    connection.execute(text("DROP TABLE logs"))
+    connection.execute(text("ALTER TABLE logs_legacy RENAME TO logs"))
+
+
+def _migrate_legacy_logs_table(connection) -> bool:
+    # Convert logs rows with inline message text and DATETIME created_at into the compact
+    # layout: interned log_messages ids and integer epoch seconds.
+    _restore_stranded_legacy_logs(connection)
+    if "message" not in _column_names(connection, "logs"):
+        return False
+
+    connection.execute(text("ALTER TABLE logs RENAME TO logs_legacy"))
+    for index_name in ("ix_logs_id", "ix_logs_service_id", "ix_logs_created_at"):
+        connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    Base.metadata.create_all(bind=connection, tables=[LogMessage.__table__, Log.__table__])
+
+    connection.execute(
+        text(
+            "INSERT OR IGNORE INTO log_messages (text) "
+            "SELECT DISTINCT message FROM logs_legacy WHERE message IS NOT NULL"
+        )
+    )
+    connection.execute(
+        text(
+            "INSERT INTO logs "
+            "(id, service_id, status_code, response_time_ms, is_success, message_id, created_at) "
+            "SELECT l.id, l.service_id, l.status_code, l.response_time_ms, l.is_success, m.id, "
+            "CAST(strftime('%s', l.created_at) AS INTEGER) "
+            "FROM logs_legacy AS l LEFT JOIN log_messages AS m ON m.text = l.message"
+        )
+    )
+    connection.execute(text("DROP TABLE logs_legacy"))
+    return True
+
+
+def run_legacy_sqlite_migrations() -> None:
+    if not settings.DATABASE_URL.startswith("sqlite"):
+        return
+
+    # pysqlite does not BEGIN before DDL, so each statement would otherwise commit on its own.
+    # Drive the transaction explicitly so a failed or interrupted conversion leaves no trace.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("BEGIN"))
+        try:
+            # Repair legacy local DBs where projects.name was accidentally created as projects."255".
+            column_names = _column_names(connection, "projects")
+            if "255" in column_names and "name" not in column_names:
+                connection.execute(text('ALTER TABLE projects RENAME COLUMN "255" TO name'))
+
+            logs_migrated = _migrate_legacy_logs_table(connection)
+        except BaseException:
+            connection.execute(text("ROLLBACK"))
+            raise
+        connection.execute(text("COMMIT"))
+
+    if logs_migrated:
+        # VACUUM cannot run inside a transaction; it hands the freed pages back to the filesystem.
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
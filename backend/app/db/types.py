@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+
+class EpochDateTime(TypeDecorator):
+    """Store datetimes as integer UTC epoch seconds.
+
+    Values are returned as naive UTC datetimes so callers keep working with
+    the same objects `datetime.utcnow` produces. Naive inputs are assumed to be UTC.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return int(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
@@ -1,32 +1,30 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
 
 from app.core.config import settings
 from app.db.base import Base
-from app.db.session import engine
-from app.routers import auth, logs, projects, services
-
-
-def _run_legacy_sqlite_migrations() -> None:
-    # Repair legacy local DBs where projects.name was accidentally created as projects."255".
-    if not settings.DATABASE_URL.startswith("sqlite"):
-        return
-
-    with engine.begin() as connection:
-        columns = connection.execute(text("PRAGMA table_info(projects)")).fetchall()
-        column_names = {row[1] for row in columns}
-        if "255" in column_names and "name" not in column_names:
-            connection.execute(text('ALTER TABLE projects RENAME COLUMN "255" TO name'))
+from app.db.migrations import run_legacy_sqlite_migrations
+from app.db.session import SessionLocal, engine
+from app.routers import auth, logs, projects, services, slos
+from app.services.slo import slo_tracker
+from app.tasks.slo_evaluation import run_slo_evaluation
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    _run_legacy_sqlite_migrations()
+    run_legacy_sqlite_migrations()
     Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        slo_tracker.load(db)
+
+    evaluation = asyncio.create_task(run_slo_evaluation())
     yield
+    evaluation.cancel()
+    with suppress(asyncio.CancelledError):
+        await evaluation
 
 
 app = FastAPI(
@@ -47,6 +45,7 @@ app.include_router(auth.router)
 app.include_router(projects.router)
 app.include_router(services.router)
 app.include_router(logs.router)
+app.include_router(slos.router)
 
 
 @app.get("/health")
@@ -3,25 +3,35 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import EpochDateTime
 
 if TYPE_CHECKING:
+    from app.models.log_message import LogMessage
     from app.models.service import Service
 
 
 class Log(Base):
     __tablename__ = "logs"
+    # The composite index serves per-service filtering plus created_at ordering, so service_id
+    # needs no index of its own.
+    __table_args__ = (Index("ix_logs_service_id_created_at", "service_id", "created_at"),)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    service_id: Mapped[int] = mapped_column(ForeignKey("services.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    service_id: Mapped[int] = mapped_column(ForeignKey("services.id"), nullable=False)
     status_code: Mapped[int] = mapped_column(Integer, nullable=False)
     response_time_ms: Mapped[int] = mapped_column(Integer, nullable=False)
     is_success: Mapped[bool] = mapped_column(Boolean, nullable=False)
-    # Keep nullable in DB, but avoid Optional[] typing because SQLAlchemy 2.0.38 + Python 3.14 can crash on union parsing.
-    message: Mapped[str] = mapped_column(String(500), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    # Messages repeat heavily, so rows only reference an interned entry in log_messages.
+    message_id: Mapped[int] = mapped_column(ForeignKey("log_messages.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(EpochDateTime, default=datetime.utcnow, index=True)
 
     service: Mapped[Service] = relationship("Service", back_populates="logs")
+    message_entry: Mapped[LogMessage] = relationship("LogMessage", lazy="joined")
+
+    @property
+    def message(self) -> str | None:
+        return self.message_entry.text if self.message_entry is not None else None
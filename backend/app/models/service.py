@@ -11,6 +11,7 @@ from app.db.base import Base
 if TYPE_CHECKING:
     from app.models.log import Log
     from app.models.project import Project
+    from app.models.slo import SLO
 
 
 class Service(Base):
@@ -28,3 +29,6 @@ class Service(Base):
     logs: Mapped[list[Log]] = relationship(
         "Log", back_populates="service", cascade="all, delete-orphan"
     )
+    slo: Mapped[SLO] = relationship(
+        "SLO", back_populates="service", uselist=False, cascade="all, delete-orphan"
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.models.service import Service
+
+
+class SLO(Base):
+    __tablename__ = "slos"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    service_id: Mapped[int] = mapped_column(ForeignKey("services.id"), nullable=False, unique=True)
+    # Percentage of checks that must be good over the window, e.g. 99.9.
+    availability_target: Mapped[float] = mapped_column(Float, nullable=False)
+    # When set, successful checks slower than this also count against the error budget.
+    latency_threshold_ms: Mapped[int] = mapped_column(Integer, nullable=True)
+    window_days: Mapped[int] = mapped_column(Integer, default=30, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    service: Mapped[Service] = relationship("Service", back_populates="slo")
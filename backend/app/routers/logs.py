@@ -10,6 +10,8 @@ from app.models.project import Project
 from app.models.service import Service
 from app.models.user import User
 from app.schemas.log import LogCreate, LogOut
+from app.services.log_messages import intern_message
+from app.services.slo import slo_tracker
 
 router = APIRouter(prefix="/projects/{project_id}/services/{service_id}/logs", tags=["logs"])
 
@@ -50,11 +52,13 @@ def create_log(
         status_code=payload.status_code,
         response_time_ms=payload.response_time_ms,
         is_success=payload.is_success,
-        message=payload.message,
+        message_id=intern_message(db, payload.message),
     )
     db.add(log)
     db.commit()
     db.refresh(log)
+
+    slo_tracker.record(service_id, log.id, log.created_at, log.is_success, log.response_time_ms)
     return log
 
 
@@ -84,4 +88,4 @@ def list_logs(
     if to_time is not None:
         query = query.filter(Log.created_at <= to_time)
 
-    return query.order_by(Log.created_at.desc()).offset(skip).limit(limit).all()
+    return query.order_by(Log.created_at.desc(), Log.id.desc()).offset(skip).limit(limit).all()
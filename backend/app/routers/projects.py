@@ -6,6 +6,7 @@ from app.db.session import get_db
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectOut, ProjectUpdate
+from app.services.slo import slo_tracker
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -85,7 +86,10 @@ def delete_project(
     current_user: User = Depends(get_current_user),
 ):
     project = _get_project_for_user_or_404(db, project_id, current_user.id)
+    service_ids = [service.id for service in project.services]
 
     db.delete(project)
     db.commit()
+    for service_id in service_ids:
+        slo_tracker.forget(service_id)
     return None
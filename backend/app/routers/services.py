@@ -9,6 +9,7 @@ from app.models.project import Project
 from app.models.service import Service
 from app.models.user import User
 from app.schemas.service import ServiceCreate, ServiceOut, ServiceUpdate
+from app.services.slo import slo_tracker
 
 
 class ServiceStatusFilter(str, Enum):
@@ -131,4 +132,5 @@ def delete_service(
 
     db.delete(service)
     db.commit()
+    slo_tracker.forget(service_id)
     return None
@@ -0,0 +1,130 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.security import get_current_user
+from app.db.session import get_db
+from app.models.project import Project
+from app.models.service import Service
+from app.models.slo import SLO
+from app.models.user import User
+from app.schemas.slo import SLOCreate, SLOOut, SLOStatus
+from app.services.slo import slo_tracker
+
+router = APIRouter(prefix="/projects/{project_id}", tags=["slos"])
+
+
+def _get_project_for_user_or_404(db: Session, project_id: int, user_id: int) -> Project:
+    project = (
+        db.query(Project)
+        .filter(Project.id == project_id, Project.owner_id == user_id)
+        .first()
+    )
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
+
+def _get_service_for_user_or_404(
+    db: Session,
+    project_id: int,
+    service_id: int,
+    user_id: int,
+) -> Service:
+    service = (
+        db.query(Service)
+        .join(Project, Project.id == Service.project_id)
+        .filter(
+            Service.id == service_id,
+            Service.project_id == project_id,
+            Project.owner_id == user_id,
+        )
+        .first()
+    )
+    if not service:
+        raise HTTPException(status_code=404, detail="Service not found in this project")
+    return service
+
+
+def _slo_status(db: Session, slo: SLO) -> SLOStatus | None:
+    # Another worker may have created or changed the SLO; seed it here if our copy is stale.
+    if not slo_tracker.is_tracking(slo.service_id, slo):
+        slo_tracker.track(db, slo)
+    status_data = slo_tracker.status(slo.service_id)
+    if status_data is None:
+        # The SLO or its service was deleted concurrently.
+        return None
+    return SLOStatus(slo=slo, **status_data)
+
+
+@router.put("/services/{service_id}/slo", response_model=SLOOut)
+def put_slo(
+    project_id: int,
+    service_id: int,
+    payload: SLOCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    service = _get_service_for_user_or_404(db, project_id, service_id, current_user.id)
+
+    slo = service.slo
+    if slo is None:
+        slo = SLO(service_id=service_id)
+        db.add(slo)
+    for key, value in payload.model_dump().items():
+        setattr(slo, key, value)
+
+    db.commit()
+    db.refresh(slo)
+
+    slo_tracker.track(db, slo)
+    return slo
+
+
+@router.get("/services/{service_id}/slo", response_model=SLOStatus)
+def get_slo_status(
+    project_id: int,
+    service_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    service = _get_service_for_user_or_404(db, project_id, service_id, current_user.id)
+    slo_status = _slo_status(db, service.slo) if service.slo is not None else None
+    if slo_status is None:
+        raise HTTPException(status_code=404, detail="No SLO defined for this service")
+    return slo_status
+
+
+@router.delete("/services/{service_id}/slo", status_code=status.HTTP_204_NO_CONTENT)
+def delete_slo(
+    project_id: int,
+    service_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    service = _get_service_for_user_or_404(db, project_id, service_id, current_user.id)
+    if service.slo is None:
+        raise HTTPException(status_code=404, detail="No SLO defined for this service")
+
+    db.delete(service.slo)
+    db.commit()
+    slo_tracker.forget(service_id)
+    return None
+
+
+@router.get("/slos", response_model=list[SLOStatus])
+def list_slo_statuses(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    _get_project_for_user_or_404(db, project_id, current_user.id)
+
+    slos = (
+        db.query(SLO)
+        .join(Service, Service.id == SLO.service_id)
+        .filter(Service.project_id == project_id)
+        .order_by(SLO.service_id)
+        .all()
+    )
+    statuses = (_slo_status(db, slo) for slo in slos)
+    return [slo_status for slo_status in statuses if slo_status is not None]
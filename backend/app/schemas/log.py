@@ -21,3 +21,8 @@ class LogOut(BaseModel):
     is_success: bool
     message: Optional[str] = None
     created_at: datetime
+
+
+class LogImport(LogCreate):
+    service_id: int
+    created_at: datetime
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SLOCreate(BaseModel):
+    availability_target: float = Field(gt=0, lt=100)
+    latency_threshold_ms: Optional[int] = Field(default=None, ge=1, le=120000)
+    window_days: int = Field(default=30, ge=1, le=90)
+
+
+class SLOOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    service_id: int
+    availability_target: float
+    latency_threshold_ms: Optional[int] = None
+    window_days: int
+    created_at: datetime
+
+
+class BurnRateWindow(BaseModel):
+    window: str
+    total: int
+    bad: int
+    error_rate: float
+    burn_rate: float
+
+
+class SLOStatus(BaseModel):
+    slo: SLOOut
+    windows: list[BurnRateWindow]
+    error_budget_remaining: float
+    alert: Optional[str] = None
@@ -0,0 +1,48 @@
+from collections.abc import Iterable
+
+from sqlalchemy import Connection, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.log_message import LogMessage
+
+# Stay well below SQLite's default limit on bound parameters per statement.
+_IN_CLAUSE_BATCH = 500
+
+
+def intern_message(db: Session, text: str | None) -> int | None:
+    """Return the log_messages id for `text`, inserting it on first use."""
+    if text is None:
+        return None
+
+    message_id = db.query(LogMessage.id).filter(LogMessage.text == text).scalar()
+    if message_id is not None:
+        return message_id
+
+    try:
+        with db.begin_nested():
+            entry = LogMessage(text=text)
+            db.add(entry)
+        return entry.id
+    except IntegrityError:
+        # Another writer interned the same text between our lookup and insert.
+        return db.query(LogMessage.id).filter(LogMessage.text == text).scalar()
+
+
+def intern_messages(db: Session | Connection, texts: Iterable[str]) -> dict[str, int]:
+    """Bulk variant of `intern_message`, returning a text -> id mapping for `texts`."""
+    pending = set(texts)
+    message_ids: dict[str, int] = {}
+
+    def _load_existing(candidates: list[str]) -> None:
+        for start in range(0, len(candidates), _IN_CLAUSE_BATCH):
+            batch = candidates[start : start + _IN_CLAUSE_BATCH]
+            rows = db.execute(select(LogMessage.id, LogMessage.text).where(LogMessage.text.in_(batch)))
+            message_ids.update({text: message_id for message_id, text in rows})
+
+    _load_existing(list(pending))
+    missing = [text for text in pending if text not in message_ids]
+    if missing:
+        db.execute(insert(LogMessage), [{"text": text} for text in missing])
+        _load_existing(missing)
+    return message_ids
@@ -0,0 +1,332 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from sqlalchemy import Integer, and_, case, func, or_, select, type_coerce
+from sqlalchemy.orm import Session
+
+from app.models.log import Log
+from app.models.slo import SLO
+
+logger = logging.getLogger(__name__)
+
+# (name, window seconds, bucket seconds) for the short burn-rate windows. The SLO's own
+# compliance window is tracked alongside these with hourly buckets.
+BURN_RATE_WINDOWS = (
+    ("5m", 300, 10),
+    ("30m", 1800, 60),
+    ("1h", 3600, 60),
+    ("6h", 21600, 300),
+)
+SLO_WINDOW_BUCKET_SECONDS = 3600
+
+# (severity, long window, short window, burn-rate threshold): the multiwindow, multi-burn-rate
+# rules. Both windows must burn faster than the threshold, so alerts fire quickly on a sharp
+# outage and reset soon after it ends.
+ALERT_RULES = (
+    ("page", "1h", "5m", 14.4),
+    ("ticket", "6h", "30m", 6.0),
+)
+
+# Stay well below SQLite's default limit on bound parameters per statement.
+_IN_CLAUSE_BATCH = 500
+
+_created_epoch = type_coerce(Log.created_at, Integer)
+
+
+def _epoch(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _definition(slo: SLO) -> tuple:
+    return (slo.availability_target, slo.latency_threshold_ms, slo.window_days)
+
+
+class SlidingWindowCounter:
+    """Total and bad event counts over a trailing window, kept in a ring of fixed-width buckets.
+
+    Recording and reading are O(1) amortised: buckets leaving the window are subtracted from the
+    running sums as time advances, so nothing is ever re-summed.
+    """
+
+    __slots__ = ("bucket_seconds", "size", "totals", "bads", "total", "bad", "head")
+
+    def __init__(self, window_seconds: int, bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self.size = max(1, window_seconds // bucket_seconds)
+        self.totals = [0] * self.size
+        self.bads = [0] * self.size
+        self.total = 0
+        self.bad = 0
+        self.head: int | None = None
+
+    def _advance(self, bucket: int) -> None:
+        if self.head is None:
+            self.head = bucket
+            return
+        if bucket <= self.head:
+            return
+        for expired in range(max(self.head + 1, bucket - self.size + 1), bucket + 1):
+            slot = expired % self.size
+            self.total -= self.totals[slot]
+            self.bad -= self.bads[slot]
+            self.totals[slot] = 0
+            self.bads[slot] = 0
+        self.head = bucket
+
+    def add(self, timestamp: int, total: int = 1, bad: int = 0) -> None:
+        bucket = timestamp // self.bucket_seconds
+        self._advance(bucket)
+        if bucket <= self.head - self.size:
+            return
+        slot = bucket % self.size
+        self.totals[slot] += total
+        self.bads[slot] += bad
+        self.total += total
+        self.bad += bad
+
+    def counts(self, now: int) -> tuple[int, int]:
+        self._advance(now // self.bucket_seconds)
+        return self.total, self.bad
+
+
+class _ServiceSLOState:
+    __slots__ = (
+        "definition",
+        "availability_target",
+        "latency_threshold_ms",
+        "window_name",
+        "seeded_through",
+        "counters",
+    )
+
+    def __init__(self, slo: SLO):
+        self.definition = _definition(slo)
+        self.availability_target = slo.availability_target
+        self.latency_threshold_ms = slo.latency_threshold_ms
+        self.window_name = f"{slo.window_days}d"
+        # Logs with ids up to this one are already in the seeded counters.
+        self.seeded_through = 0
+        self.counters = {
+            name: SlidingWindowCounter(window_seconds, bucket_seconds)
+            for name, window_seconds, bucket_seconds in BURN_RATE_WINDOWS
+        }
+        self.counters[self.window_name] = SlidingWindowCounter(
+            slo.window_days * 86400, SLO_WINDOW_BUCKET_SECONDS
+        )
+
+    def is_bad(self, is_success: bool, response_time_ms: int) -> bool:
+        if not is_success:
+            return True
+        return self.latency_threshold_ms is not None and response_time_ms > self.latency_threshold_ms
+
+    def record(self, log_id: int, timestamp: int, is_success: bool, response_time_ms: int) -> None:
+        if log_id <= self.seeded_through:
+            return
+        bad = int(self.is_bad(is_success, response_time_ms))
+        for counter in self.counters.values():
+            counter.add(timestamp, 1, bad)
+
+
+class SLOTracker:
+    """In-process SLO state for every service that declares an SLO.
+
+    Counters are seeded from `logs` once, when the tracker loads or an SLO changes, and are then
+    kept current by `record` on ingestion. Evaluations only read the counters.
+
+    Seeding queries run without holding the lock. Checks recorded meanwhile are buffered and
+    replayed into the new state when it is swapped in.
+    """
+
+    def __init__(self):
+        self._states: dict[int, _ServiceSLOState] = {}
+        self._alerts: dict[int, str | None] = {}
+        self._pending: dict[int, list[list[tuple[int, int, bool, int]]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        self._seed_and_swap(db, db.query(SLO).all(), replace_all=True)
+
+    def track(self, db: Session, slo: SLO) -> None:
+        self._seed_and_swap(db, [slo], replace_all=False)
+
+    def forget(self, service_id: int) -> None:
+        with self._lock:
+            self._states.pop(service_id, None)
+            self._alerts.pop(service_id, None)
+            # Any seed still running for this service is discarded instead of being swapped in.
+            self._pending.pop(service_id, None)
+
+    def is_tracking(self, service_id: int, slo: SLO) -> bool:
+        state = self._states.get(service_id)
+        return state is not None and state.definition == _definition(slo)
+
+    def record(
+        self,
+        service_id: int,
+        log_id: int,
+        created_at: datetime,
+        is_success: bool,
+        response_time_ms: int,
+    ) -> None:
+        event = (log_id, _epoch(created_at), is_success, response_time_ms)
+        with self._lock:
+            for buffer in self._pending.get(service_id, ()):
+                buffer.append(event)
+            state = self._states.get(service_id)
+            if state is not None:
+                state.record(*event)
+
+    def status(self, service_id: int, now: int | None = None) -> dict | None:
+        with self._lock:
+            state = self._states.get(service_id)
+            if state is None:
+                return None
+            return self._evaluate(state, int(time.time()) if now is None else now)
+
+    def evaluate_all(self, now: int | None = None) -> dict[int, str | None]:
+        """Evaluate every tracked SLO, logging alerts as they start and stop firing."""
+        now = int(time.time()) if now is None else now
+        with self._lock:
+            alerts = {
+                service_id: self._evaluate(state, now)["alert"]
+                for service_id, state in self._states.items()
+            }
+            for service_id, alert in alerts.items():
+                previous = self._alerts.get(service_id)
+                if alert != previous:
+                    if alert is not None:
+                        logger.warning("SLO %s alert firing for service %s", alert, service_id)
+                    else:
+                        logger.info("SLO %s alert resolved for service %s", previous, service_id)
+            self._alerts = alerts
+        return alerts
+
+    @staticmethod
+    def _evaluate(state: _ServiceSLOState, now: int) -> dict:
+        error_budget = 1 - state.availability_target / 100
+        windows = []
+        burn_rates = {}
+        for name, counter in state.counters.items():
+            total, bad = counter.counts(now)
+            error_rate = bad / total if total else 0.0
+            burn_rates[name] = error_rate / error_budget
+            windows.append(
+                {
+                    "window": name,
+                    "total": total,
+                    "bad": bad,
+                    "error_rate": error_rate,
+                    "burn_rate": burn_rates[name],
+                }
+            )
+
+        alert = None
+        for severity, long_window, short_window, threshold in ALERT_RULES:
+            if burn_rates[long_window] > threshold and burn_rates[short_window] > threshold:
+                alert = severity
+                break
+
+        return {
+            "windows": windows,
+            "error_budget_remaining": 1 - burn_rates[state.window_name],
+            "alert": alert,
+        }
+
+    def _seed_and_swap(self, db: Session, slos: list[SLO], replace_all: bool) -> None:
+        states = {slo.service_id: _ServiceSLOState(slo) for slo in slos}
+        buffers: dict[int, list[tuple[int, int, bool, int]]] = {service_id: [] for service_id in states}
+        with self._lock:
+            for service_id, buffer in buffers.items():
+                self._pending.setdefault(service_id, []).append(buffer)
+
+        seeded = False
+        try:
+            # The seed cut-off is a log id, not a timestamp: with a single writer, every log committed
+            # after this read gets a higher id and reaches `record` while our buffer is registered.
+            seeded_through = db.query(func.max(Log.id)).scalar() or 0
+            for state in states.values():
+                state.seeded_through = seeded_through
+            self._seed(db, states, seeded_through, int(time.time()))
+            seeded = True
+        finally:
+            with self._lock:
+                ready = {}
+                for service_id, buffer in buffers.items():
+                    pending = self._pending.get(service_id, [])
+                    if not any(candidate is buffer for candidate in pending):
+                        # Forgotten while seeding.
+                        continue
+                    remaining = [candidate for candidate in pending if candidate is not buffer]
+                    if remaining:
+                        self._pending[service_id] = remaining
+                    else:
+                        del self._pending[service_id]
+
+                    state = states[service_id]
+                    for event in buffer:
+                        state.record(*event)
+                    ready[service_id] = state
+
+                if seeded and replace_all:
+                    self._states = ready
+                    self._alerts = {service_id: self._alerts.get(service_id) for service_id in ready}
+                elif seeded:
+                    self._states.update(ready)
+
+    @staticmethod
+    def _seed(db: Session, states: dict[int, _ServiceSLOState], seeded_through: int, now: int) -> None:
+        if not states:
+            return
+
+        # Group counters by (window, bucket) so each shape costs one aggregate query over logs.
+        counters_by_shape: dict[tuple[int, int], list[tuple[int, SlidingWindowCounter]]] = defaultdict(list)
+        for service_id, state in states.items():
+            for counter in state.counters.values():
+                window_seconds = counter.size * counter.bucket_seconds
+                counters_by_shape[(window_seconds, counter.bucket_seconds)].append((service_id, counter))
+
+        bad = case(
+            (
+                or_(
+                    Log.is_success.is_(False),
+                    and_(
+                        SLO.latency_threshold_ms.is_not(None),
+                        Log.response_time_ms > SLO.latency_threshold_ms,
+                    ),
+                ),
+                1,
+            ),
+            else_=0,
+        )
+        for (window_seconds, bucket_seconds), counters in counters_by_shape.items():
+            counters_by_service: dict[int, list[SlidingWindowCounter]] = defaultdict(list)
+            for service_id, counter in counters:
+                counters_by_service[service_id].append(counter)
+
+            service_ids = list(counters_by_service)
+            bucket = _created_epoch // bucket_seconds
+            for start in range(0, len(service_ids), _IN_CLAUSE_BATCH):
+                rows = db.execute(
+                    select(Log.service_id, bucket, func.count(), func.sum(bad))
+                    .join(SLO, SLO.service_id == Log.service_id)
+                    .where(
+                        Log.service_id.in_(service_ids[start : start + _IN_CLAUSE_BATCH]),
+                        Log.id <= seeded_through,
+                        _created_epoch > now - window_seconds,
+                    )
+                    .group_by(Log.service_id, bucket)
+                )
+                for service_id, bucket_index, total, bad_total in rows:
+                    for counter in counters_by_service[service_id]:
+                        counter.add(bucket_index * bucket_seconds, total, bad_total)
+
+            for _, counter in counters:
+                counter.counts(now)
+
+
+slo_tracker = SLOTracker()
@@ -0,0 +1,18 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.services.slo import slo_tracker
+
+logger = logging.getLogger(__name__)
+
+
+async def run_slo_evaluation() -> None:
+    # Evaluation only reads in-memory counters; run it off the event loop so requests keep flowing.
+    while True:
+        try:
+            await asyncio.to_thread(slo_tracker.evaluate_all)
+        except Exception:
+            # Keep evaluating on later passes; one failure must not stop alerting until a restart.
+            logger.exception("SLO evaluation pass failed")
+        await asyncio.sleep(settings.SLO_EVALUATION_INTERVAL_SECONDS)
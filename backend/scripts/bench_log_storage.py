@@ -0,0 +1,162 @@
+"""Compare on-disk size and scan speed of the legacy and compact `logs` layouts.
+
+Both layouts get the same indexes, so the comparison isolates the row format: inline message
+text and DATETIME strings versus interned message ids and integer epoch seconds.
+
+Run from the backend directory:
+
+    python -m scripts.bench_log_storage --rows 2000000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+
+from app.db.base import Base
+
+LEGACY_SCHEMA = """
+CREATE TABLE logs (
+    id INTEGER NOT NULL,
+    service_id INTEGER NOT NULL,
+    status_code INTEGER NOT NULL,
+    response_time_ms INTEGER NOT NULL,
+    is_success BOOLEAN NOT NULL,
+    message VARCHAR(500),
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_logs_created_at ON logs (created_at);
+CREATE INDEX ix_logs_service_id_created_at ON logs (service_id, created_at);
+"""
+
+MESSAGES = [
+    "Health check OK",
+    "timeout",
+    "connection refused",
+    "Upstream unavailable",
+    "Bad gateway",
+    '{"error": "internal server error", "detail": "database connection pool exhausted"}',
+]
+
+SCAN_QUERIES = {
+    "failures per service": "SELECT service_id, COUNT(*) FROM logs WHERE is_success = 0 GROUP BY service_id",
+    "avg latency, last day": "SELECT AVG(response_time_ms) FROM logs WHERE created_at >= :since",
+    "latest page, one service": (
+        "SELECT * FROM logs WHERE service_id = 7 ORDER BY created_at DESC, id DESC LIMIT 20"
+    ),
+}
+
+
+def _generate_rows(rows: int, services: int, seed: int):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    for log_id in range(1, rows + 1):
+        message_index = 0 if rng.random() < 0.9 else rng.randrange(1, len(MESSAGES))
+        created_at = start + timedelta(seconds=log_id * 5)
+        yield (
+            log_id,
+            rng.randrange(1, services + 1),
+            200 if message_index == 0 else rng.choice((500, 502, 503, 504)),
+            rng.randrange(20, 2000),
+            message_index == 0,
+            message_index,
+            created_at,
+        )
+
+
+def _build_legacy(path: str, rows: int, services: int, seed: int) -> datetime:
+    connection = sqlite3.connect(path)
+    connection.executescript(LEGACY_SCHEMA)
+    last = None
+    with connection:
+        for row in _generate_rows(rows, services, seed):
+            log_id, service_id, status_code, latency, ok, message_index, created_at = row
+            connection.execute(
+                "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (log_id, service_id, status_code, latency, ok, MESSAGES[message_index],
+                 created_at.strftime("%Y-%m-%d %H:%M:%S.%f")),
+            )
+            last = created_at
+    connection.close()
+    return last
+
+
+def _build_compact(path: str, rows: int, services: int, seed: int) -> int:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    connection = sqlite3.connect(path)
+    last = None
+    with connection:
+        connection.executemany(
+            "INSERT INTO log_messages (id, text) VALUES (?, ?)",
+            [(index + 1, text) for index, text in enumerate(MESSAGES)],
+        )
+        for row in _generate_rows(rows, services, seed):
+            log_id, service_id, status_code, latency, ok, message_index, created_at = row
+            epoch = int((created_at - datetime(1970, 1, 1)).total_seconds())
+            connection.execute(
+                "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (log_id, service_id, status_code, latency, ok, message_index + 1, epoch),
+            )
+            last = epoch
+    connection.close()
+    return last
+
+
+def _time_queries(path: str, since, repeats: int) -> dict[str, float]:
+    connection = sqlite3.connect(path)
+    timings = {}
+    for name, sql in SCAN_QUERIES.items():
+        started = time.perf_counter()
+        for _ in range(repeats):
+            connection.execute(sql, {"since": since}).fetchall()
+        timings[name] = (time.perf_counter() - started) / repeats * 1000
+    connection.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--services", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        legacy_path = os.path.join(workdir, "legacy.db")
+        compact_path = os.path.join(workdir, "compact.db")
+
+        legacy_last = _build_legacy(legacy_path, args.rows, args.services, args.seed)
+        compact_last = _build_compact(compact_path, args.rows, args.services, args.seed)
+
+        legacy_since = (legacy_last - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S.%f")
+        compact_since = compact_last - 86400
+        legacy_timings = _time_queries(legacy_path, legacy_since, args.repeats)
+        compact_timings = _time_queries(compact_path, compact_since, args.repeats)
+
+        legacy_size = os.path.getsize(legacy_path)
+        compact_size = os.path.getsize(compact_path)
+
+    print(f"rows: {args.rows:,}  services: {args.services}")
+    print(f"{'':28}{'legacy':>12}{'compact':>12}{'ratio':>8}")
+    print(
+        f"{'file size (MiB)':28}{legacy_size / 2**20:>12.1f}{compact_size / 2**20:>12.1f}"
+        f"{legacy_size / compact_size:>8.2f}"
+    )
+    for name in SCAN_QUERIES:
+        legacy_ms = legacy_timings[name]
+        compact_ms = compact_timings[name]
+        print(f"{name + ' (ms)':28}{legacy_ms:>12.2f}{compact_ms:>12.2f}{legacy_ms / compact_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
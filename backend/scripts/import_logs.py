@@ -0,0 +1,388 @@
+"""Bulk-import historical check logs from NDJSON or CSV files.
+
+Run from the backend directory:
+
+    python -m scripts.import_logs history.ndjson
+    python -m scripts.import_logs history.csv --chunk-size 100000
+
+Each row needs service_id, status_code, response_time_ms, is_success and created_at
+(ISO 8601 or epoch seconds); message is optional. Rows are validated with the same
+rules as `POST .../logs/` and rejected rows are reported, not imported.
+
+The file offset reached is stored in import_checkpoints in the same transaction as each
+chunk, so rerunning the same command after an interruption resumes where it stopped.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+
+from app.db.base import Base
+from app.db.migrations import run_legacy_sqlite_migrations
+from app.db.session import engine
+from app.models.log import Log
+from app.models.service import Service
+from app.schemas.log import LogImport
+from app.services.log_messages import intern_messages
+
+_READ_BUFFER_BYTES = 1 << 20
+_MAX_REPORTED_ERRORS = 20
+
+_checkpoint_metadata = MetaData()
+import_checkpoints = Table(
+    "import_checkpoints",
+    _checkpoint_metadata,
+    Column("source", String(1024), primary_key=True),
+    Column("offset", Integer, nullable=False),
+    Column("rows_imported", Integer, nullable=False),
+    Column("rows_rejected", Integer, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+_rows_adapter = TypeAdapter(list[LogImport])
+
+
+# Readers yield (record, end offset) pairs, where record is a parsed row or a rejection reason,
+# and finish with (None, end of file) so offsets skipped over by blank lines are checkpointed too.
+
+
+def _read_ndjson(path: Path, offset: int) -> Iterator[tuple[dict[str, Any] | str | None, int]]:
+    with path.open("rb", buffering=_READ_BUFFER_BYTES) as handle:
+        handle.seek(offset)
+        for line in handle:
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except UnicodeDecodeError:
+                yield "invalid UTF-8", offset
+                continue
+            except json.JSONDecodeError as exc:
+                yield f"invalid JSON ({exc.msg})", offset
+                continue
+            if not isinstance(record, dict):
+                yield "expected a JSON object", offset
+                continue
+            yield record, offset
+        yield None, offset
+
+
+def _is_valid_utf8(value: str) -> bool:
+    # Undecodable bytes survive surrogateescape decoding as lone surrogates, which cannot be encoded.
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _read_csv(path: Path, offset: int) -> Iterator[tuple[dict[str, Any] | str | None, int]]:
+    with path.open("rb", buffering=_READ_BUFFER_BYTES) as handle:
+        header_line = handle.readline()
+        # Spreadsheet exports often start with a byte order mark; keep it out of the first column name.
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        handle.seek(max(offset, len(header_line)))
+        position = [handle.tell()]
+
+        def _lines() -> Iterator[str]:
+            # Track the byte offset of what csv.reader has consumed, including quoted newlines.
+            for raw_line in handle:
+                position[0] += len(raw_line)
+                yield raw_line.decode("utf-8", errors="surrogateescape")
+
+        for row in csv.reader(_lines()):
+            if not row:
+                continue
+            if len(row) != len(header):
+                yield f"expected {len(header)} columns, got {len(row)}", position[0]
+                continue
+            if not all(_is_valid_utf8(value) for value in row):
+                yield "invalid UTF-8", position[0]
+                continue
+            # CSV has no null; treat empty cells as missing so optional fields stay None.
+            yield {key: value for key, value in zip(header, row) if value != ""}, position[0]
+        yield None, position[0]
+
+
+def _validate_chunk(records: list[dict[str, Any]]) -> tuple[list[LogImport], list[str]]:
+    """Validate a chunk in one pass, re-validating only the clean rows if any fail."""
+    try:
+        return _rows_adapter.validate_python(records), []
+    except ValidationError as exc:
+        errors = exc.errors()
+
+    errors_by_row: dict[int, list[str]] = {}
+    for error in errors:
+        field = ".".join(str(part) for part in error["loc"][1:])
+        errors_by_row.setdefault(error["loc"][0], []).append(f"{field}: {error['msg']}")
+    clean = [record for index, record in enumerate(records) if index not in errors_by_row]
+    return _rows_adapter.validate_python(clean), ["; ".join(row) for row in errors_by_row.values()]
+
+
+def _load_checkpoint(connection: Connection, source: str):
+    return connection.execute(
+        select(import_checkpoints).where(import_checkpoints.c.source == source)
+    ).first()
+
+
+def _save_checkpoint(
+    connection: Connection,
+    source: str,
+    offset: int,
+    rows_imported: int,
+    rows_rejected: int,
+    exists: bool,
+) -> None:
+    values = {
+        "offset": offset,
+        "rows_imported": rows_imported,
+        "rows_rejected": rows_rejected,
+        "updated_at": datetime.utcnow(),
+    }
+    if exists:
+        connection.execute(
+            update(import_checkpoints).where(import_checkpoints.c.source == source).values(**values)
+        )
+    else:
+        connection.execute(insert(import_checkpoints).values(source=source, **values))
+
+
+def _rebuild_aggregates() -> None:
+    # Refresh the query planner's statistics now that the logs table has grown substantially.
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE logs"))
+
+
+class _Importer:
+    def __init__(
+        self,
+        source: str,
+        service_ids: set[int],
+        offset: int,
+        rows_imported: int,
+        rows_rejected: int,
+        checkpoint_exists: bool,
+    ):
+        self.source = source
+        self.service_ids = service_ids
+        self.offset = offset
+        self.message_ids: dict[str, int] = {}
+        self.rows_imported = rows_imported
+        self.rows_rejected = rows_rejected
+        self.checkpoint_exists = checkpoint_exists
+        self.reported_errors = 0
+
+    def _reject(self, reason: str) -> None:
+        self.rows_rejected += 1
+        if self.reported_errors < _MAX_REPORTED_ERRORS:
+            print(f"rejected row: {reason}", file=sys.stderr)
+            self.reported_errors += 1
+
+    def write_chunk(self, records: list[dict[str, Any] | str], offset: int) -> int:
+        parsed: list[dict[str, Any]] = []
+        for record in records:
+            if isinstance(record, str):
+                self._reject(record)
+            else:
+                parsed.append(record)
+
+        rows, errors = _validate_chunk(parsed)
+        for error in errors:
+            self._reject(error)
+
+        values = []
+        for row in rows:
+            if row.service_id not in self.service_ids:
+                self._reject(f"service_id: unknown service {row.service_id}")
+                continue
+            values.append(row)
+
+        with engine.begin() as connection:
+            new_messages = {row.message for row in values if row.message}
+            new_messages.difference_update(self.message_ids)
+            if new_messages:
+                self.message_ids.update(intern_messages(connection, new_messages))
+
+            if values:
+                connection.execute(
+                    insert(Log),
+                    [
+                        {
+                            "service_id": row.service_id,
+                            "status_code": row.status_code,
+                            "response_time_ms": row.response_time_ms,
+                            "is_success": row.is_success,
+                            "message_id": self.message_ids.get(row.message) if row.message else None,
+                            "created_at": row.created_at,
+                        }
+                        for row in values
+                    ],
+                )
+            self.rows_imported += len(values)
+            _save_checkpoint(
+                connection,
+                self.source,
+                offset,
+                self.rows_imported,
+                self.rows_rejected,
+                self.checkpoint_exists,
+            )
+            self.checkpoint_exists = True
+        self.offset = offset
+        return len(values)
+
+
+def import_logs(
+    path: Path,
+    file_format: str,
+    chunk_size: int,
+    defer_indexes: bool,
+    restart: bool,
+) -> None:
+    run_legacy_sqlite_migrations()
+    Base.metadata.create_all(bind=engine)
+    _checkpoint_metadata.create_all(bind=engine)
+
+    indexes = list(Log.__table__.indexes)
+    # A run killed during the final rebuild leaves logs without its indexes, and create_all does not
+    # add indexes to an existing table, so restore them here before anything else.
+    existing_indexes = {index["name"] for index in inspect(engine).get_indexes("logs")}
+    missing_indexes = [index for index in indexes if index.name not in existing_indexes]
+    if missing_indexes:
+        print("Rebuilding logs indexes left dropped by an interrupted import...")
+        for index in missing_indexes:
+            index.create(bind=engine)
+
+    source = str(path.resolve())
+    with engine.begin() as connection:
+        if restart:
+            connection.execute(delete(import_checkpoints).where(import_checkpoints.c.source == source))
+        checkpoint = _load_checkpoint(connection, source)
+        service_ids = set(connection.execute(select(Service.id)).scalars())
+
+    offset = checkpoint.offset if checkpoint else 0
+    importer = _Importer(
+        source,
+        service_ids,
+        offset,
+        rows_imported=checkpoint.rows_imported if checkpoint else 0,
+        rows_rejected=checkpoint.rows_rejected if checkpoint else 0,
+        checkpoint_exists=checkpoint is not None,
+    )
+    if offset >= path.stat().st_size:
+        print(f"{path} is already fully imported ({importer.rows_imported:,} rows).")
+        return
+    if offset:
+        print(f"Resuming {path} at byte {offset:,} ({importer.rows_imported:,} rows already imported).")
+
+    reader = _read_ndjson if file_format == "ndjson" else _read_csv
+    indexes_dropped = False
+
+    def _write(chunk: list[dict[str, Any] | str], end_offset: int) -> int:
+        nonlocal indexes_dropped
+        # Only drop indexes once there are rows to load, so a rerun with nothing left to import
+        # never pays for a full index rebuild.
+        if defer_indexes and chunk and not indexes_dropped:
+            for index in indexes:
+                index.drop(bind=engine, checkfirst=True)
+            indexes_dropped = True
+        return importer.write_chunk(chunk, end_offset)
+
+    started = time.perf_counter()
+    imported_this_run = 0
+    try:
+        chunk: list[dict[str, Any] | str] = []
+        end_offset = offset
+        for record, end_offset in reader(path, offset):
+            if record is None:
+                continue
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                imported_this_run += _write(chunk, end_offset)
+                chunk = []
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{importer.rows_imported:,} rows imported, {importer.rows_rejected:,} rejected, "
+                    f"{imported_this_run / elapsed:,.0f} rows/s"
+                )
+        if chunk or end_offset > importer.offset:
+            imported_this_run += _write(chunk, end_offset)
+    finally:
+        if indexes_dropped:
+            print("Rebuilding logs indexes...")
+            for index in indexes:
+                index.create(bind=engine, checkfirst=True)
+
+    if imported_this_run:
+        _rebuild_aggregates()
+    elapsed = time.perf_counter() - started
+    print(
+        f"Done: {imported_this_run:,} rows imported this run in {elapsed:,.1f}s "
+        f"({imported_this_run / elapsed:,.0f} rows/s); "
+        f"{importer.rows_imported:,} imported and {importer.rows_rejected:,} rejected in total."
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "csv"),
+        help="input format (default: inferred from the file extension)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="rows per transaction")
+    parser.add_argument(
+        "--keep-indexes",
+        action="store_true",
+        help="maintain logs indexes during the import instead of rebuilding them afterwards",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="ignore any saved checkpoint and import the file from the beginning",
+    )
+    args = parser.parse_args()
+
+    file_format = args.format
+    if file_format is None:
+        file_format = "csv" if args.path.suffix.lower() == ".csv" else "ndjson"
+
+    try:
+        import_logs(
+            args.path,
+            file_format,
+            chunk_size=args.chunk_size,
+            defer_indexes=not args.keep_indexes,
+            restart=args.restart,
+        )
+    except KeyboardInterrupt:
+        print("Interrupted; rerun the same command to resume.", file=sys.stderr)
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()